@@ -2,6 +2,10 @@ import os
 from openai import OpenAI
 from dotenv import load_dotenv
 import json
+import hashlib
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Tuple, Optional
 from pydantic import BaseModel
 
@@ -16,6 +20,30 @@ if not api_key:
 # Initialize OpenAI client
 client = OpenAI(api_key=api_key)
 
+READING_LEVELS = ('beginner', 'intermediate', 'expert')
+
+# Maximum number of documents whose speculative results are kept in memory
+MAX_CACHED_DOCUMENTS = 100
+
+# Maximum number of speculative jobs queued or running at once
+MAX_PENDING_SPECULATIVE = 8
+
+# Stored results per document: {document_id: {reading_level: {'future', 'speculative'}}}
+_speculative_results = OrderedDict()
+_speculative_stats = {
+    'launched': 0,
+    'pending': 0,
+    'completed': 0,
+    'failed': 0,
+    'cancelled': 0,
+    'requested_while_queued': 0,
+    'used': 0,
+    'wasted': 0,
+}
+# Re-entrant because cancelling a future runs its done callbacks in the calling thread
+_speculative_lock = threading.RLock()
+_speculative_executor = ThreadPoolExecutor(max_workers=4)
+
 def simplify_text(text: str, reading_level: str) -> str:
     """
     Simplify text using OpenAI's GPT-4 model.
@@ -54,3 +82,183 @@ def simplify_text(text: str, reading_level: str) -> str:
     except Exception as e:
         print(f"Error in simplification: {str(e)}")
         raise Exception("Failed to simplify text")
+
+def get_document_id(text: str) -> str:
+    """
+    Build a stable identifier for a document from its text.
+
+    Args:
+        text (str): The original document text
+
+    Returns:
+        str: The document identifier
+    """
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+def simplify_text_speculative(text: str, reading_level: str) -> str:
+    """
+    Simplify text for the requested reading level and pre-compute the other
+    levels in the background, so a later level switch for the same document
+    is served from stored results instead of a new LLM call.
+
+    Args:
+        text (str): The text to simplify
+        reading_level (str): The target reading level (beginner, intermediate, expert)
+
+    Returns:
+        str: The simplified text
+    """
+    if reading_level not in READING_LEVELS:
+        reading_level = 'intermediate'
+
+    document_id = get_document_id(text)
+
+    with _speculative_lock:
+        levels = _get_document_levels(document_id)
+        entry = levels.get(reading_level)
+
+        # A speculative job still waiting in the queue is slower than a direct call
+        if entry is not None and entry['speculative']:
+            entry['requested'] = True
+            if entry['future'].cancel():
+                entry = None
+
+        is_owner = entry is None
+        if is_owner:
+            # Register the level before calling the LLM so concurrent requests wait on it
+            entry = {'future': Future(), 'speculative': False}
+            levels[reading_level] = entry
+
+        _launch_speculative(text, document_id, levels, exclude=reading_level)
+
+    if is_owner:
+        try:
+            simplified_text = simplify_text(text, reading_level)
+        except Exception as e:
+            with _speculative_lock:
+                if levels.get(reading_level) is entry:
+                    del levels[reading_level]
+            entry['future'].set_exception(e)
+            raise
+        entry['future'].set_result(simplified_text)
+        return simplified_text
+
+    try:
+        # Waits if the request for this level is already running
+        simplified_text = entry['future'].result()
+    except Exception:
+        with _speculative_lock:
+            if levels.get(reading_level) is entry:
+                del levels[reading_level]
+        return simplify_text(text, reading_level)
+
+    with _speculative_lock:
+        # Only the first use of a speculative result counts as a hit
+        if entry['speculative']:
+            entry['speculative'] = False
+            _speculative_stats['used'] += 1
+
+    return simplified_text
+
+def prefetch_levels(text: str) -> None:
+    """
+    Start generating every reading level not yet stored for a document.
+
+    Args:
+        text (str): The original document text
+    """
+    document_id = get_document_id(text)
+
+    with _speculative_lock:
+        levels = _get_document_levels(document_id)
+        _launch_speculative(text, document_id, levels)
+
+def _get_document_levels(document_id: str) -> dict:
+    # Must be called with _speculative_lock held
+    levels = _speculative_results.get(document_id)
+    if levels is not None:
+        _speculative_results.move_to_end(document_id)
+        return levels
+
+    levels = {}
+    _speculative_results[document_id] = levels
+
+    while len(_speculative_results) > MAX_CACHED_DOCUMENTS:
+        _, evicted = _speculative_results.popitem(last=False)
+        for entry in evicted.values():
+            if not entry['speculative'] or entry['future'].cancel():
+                continue
+            if entry['future'].done():
+                # Finished but never served
+                entry['speculative'] = False
+                _speculative_stats['wasted'] += 1
+
+    return levels
+
+def _launch_speculative(text: str, document_id: str, levels: dict, exclude: Optional[str] = None) -> None:
+    # Must be called with _speculative_lock held
+    for level in READING_LEVELS:
+        if level == exclude or level in levels:
+            continue
+        if _speculative_stats['pending'] >= MAX_PENDING_SPECULATIVE:
+            break
+
+        entry = {
+            'future': _speculative_executor.submit(simplify_text, text, level),
+            'speculative': True,
+        }
+        levels[level] = entry
+        _speculative_stats['launched'] += 1
+        _speculative_stats['pending'] += 1
+        entry['future'].add_done_callback(
+            lambda future, level=level, entry=entry: _record_speculative_outcome(
+                document_id, levels, level, entry
+            )
+        )
+
+def _record_speculative_outcome(document_id: str, levels: dict, level: str, entry: dict) -> None:
+    future = entry['future']
+
+    with _speculative_lock:
+        _speculative_stats['pending'] -= 1
+
+        if future.cancelled():
+            # The user asked for this level before the job started, so the guess was right
+            if entry.get('requested'):
+                _speculative_stats['requested_while_queued'] += 1
+            else:
+                _speculative_stats['cancelled'] += 1
+            return
+
+        if future.exception() is not None:
+            _speculative_stats['failed'] += 1
+            # Drop the failure so the next request for this level calls the LLM again
+            if levels.get(level) is entry:
+                del levels[level]
+            return
+
+        _speculative_stats['completed'] += 1
+        if entry['speculative'] and _speculative_results.get(document_id) is not levels:
+            # The document was evicted while this job was running
+            entry['speculative'] = False
+            _speculative_stats['wasted'] += 1
+
+def get_speculative_stats() -> dict:
+    """
+    Report how often speculatively generated levels were actually used.
+
+    The hit rate counts levels the user asked for, whether the job had
+    finished or was still queued, over completed plus requested-while-queued
+    jobs. Jobs still pending, failed or cancelled by eviction are left out.
+
+    Returns:
+        dict: Job counts, wasted results and the hit rate
+    """
+    with _speculative_lock:
+        stats = dict(_speculative_stats)
+        stats['cached_documents'] = len(_speculative_results)
+
+    hits = stats['used'] + stats['requested_while_queued']
+    decided = stats['completed'] + stats['requested_while_queued']
+    stats['hit_rate'] = hits / decided if decided else 0.0
+    return stats
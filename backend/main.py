@@ -1,9 +1,10 @@
 from fastapi import FastAPI, UploadFile, File, Form, HTTPException, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
+from starlette.concurrency import run_in_threadpool
 from pydantic import BaseModel
 from typing import Optional
-from api.simplification import simplify_text
+from api.simplification import simplify_text, simplify_text_speculative, prefetch_levels, get_speculative_stats
 from api.text_to_speech import generate_speech
 from api.document_parser import parse_document
 from api.question import answer_question
@@ -30,6 +31,10 @@ class SimplificationRequest(BaseModel):
     text: str
     reading_level: str
     text_to_speech: Optional[bool] = False
+    speculative: Optional[bool] = False
+
+class PrefetchRequest(BaseModel):
+    text: str
 
 class SimplificationResponse(BaseModel):
     simplified_text: str
@@ -43,7 +48,10 @@ async def test():
 @app.post("/api/simplify", response_model=SimplificationResponse)
 async def simplify(request: SimplificationRequest):
     try:
-        simplified = simplify_text(
+        # Speculative mode also prepares the other reading levels so a switch is instant
+        simplifier = simplify_text_speculative if request.speculative else simplify_text
+        simplified = await run_in_threadpool(
+            simplifier,
             request.text,
             request.reading_level,
         )
@@ -61,11 +69,30 @@ async def simplify(request: SimplificationRequest):
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.post("/api/simplify/prefetch")
+async def simplify_prefetch(request: PrefetchRequest):
+    """
+    Start generating every reading level for a document that is not stored yet.
+    """
+    try:
+        prefetch_levels(request.text)
+        return {"status": "ok"}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.get("/api/simplify/stats")
+async def simplify_stats():
+    """
+    Report how often speculatively generated reading levels were used.
+    """
+    return get_speculative_stats()
+
 @app.post("/api/upload")
 async def upload(
     file: UploadFile = File(...),
     reading_level: str = Form(...),
-    text_to_speech: bool = Form(False)
+    text_to_speech: bool = Form(False),
+    speculative: bool = Form(False)
 ) -> SimplificationResponse:
     try:
         # Pass the file directly to the document parser
@@ -74,7 +101,9 @@ async def upload(
         if not text.strip():
             raise Exception("No text could be extracted from the document")
             
-        simplified_text = simplify_text(
+        simplifier = simplify_text_speculative if speculative else simplify_text
+        simplified_text = await run_in_threadpool(
+            simplifier,
             text,
             reading_level,
         )
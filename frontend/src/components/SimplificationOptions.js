@@ -14,12 +14,15 @@ import {
 } from "@mui/material";
 import RecordVoiceOverIcon from '@mui/icons-material/RecordVoiceOver';
 import SchoolIcon from '@mui/icons-material/School';
+import BoltIcon from '@mui/icons-material/Bolt';
 
 const SimplificationOptions = ({
   readingLevel,
   onReadingLevelChange,
   isTextToSpeechEnabled,
   onTextToSpeechToggle,
+  isPreloadEnabled,
+  onPreloadToggle,
 }) => {
   const theme = useTheme();
 
@@ -91,6 +94,42 @@ const SimplificationOptions = ({
             </Box>
           </Paper>
         </Grid>
+
+        <Grid item xs={12}>
+          <Paper
+            elevation={0}
+            sx={{
+              p: 2,
+              borderRadius: 1,
+              border: `1px solid ${theme.palette.grey[200]}`,
+              backgroundColor: theme.palette.grey[50],
+              display: 'flex',
+              alignItems: 'center',
+              justifyContent: 'space-between',
+            }}
+          >
+            <Box sx={{ display: 'flex', alignItems: 'center', gap: 1 }}>
+              <BoltIcon sx={{ color: isPreloadEnabled ? theme.palette.primary.main : theme.palette.grey[400] }} />
+              <FormControlLabel
+                control={
+                  <Switch
+                    checked={isPreloadEnabled}
+                    onChange={(e) => onPreloadToggle(e.target.checked)}
+                    color="primary"
+                  />
+                }
+                label={
+                  <Typography variant="body1" color={isPreloadEnabled ? 'primary' : 'text.secondary'}>
+                    Preload All Reading Levels
+                  </Typography>
+                }
+              />
+            </Box>
+            <Typography variant="body2" color="text.secondary">
+              Switch levels instantly
+            </Typography>
+          </Paper>
+        </Grid>
       </Grid>
     </Box>
   );
@@ -1,4 +1,4 @@
-import React, { useState, useEffect } from "react";
+import React, { useState, useEffect, useRef } from "react";
 import axios from "axios";
 import { 
   Box, 
@@ -27,8 +27,11 @@ const SimplificationPage = () => {
   const [audioUrl, setAudioUrl] = useState(null);
   const [readingLevel, setReadingLevel] = useState("beginner");
   const [isTextToSpeechEnabled, setIsTextToSpeechEnabled] = useState(false);
+  const [isPreloadEnabled, setIsPreloadEnabled] = useState(false);
   const [isLoading, setIsLoading] = useState(false);
   const [error, setError] = useState(null);
+  // Only the most recent simplification request may update the results
+  const latestRequestRef = useRef(0);
 
   // Generate speech when toggle is switched on
   useEffect(() => {
@@ -64,7 +67,57 @@ const SimplificationPage = () => {
     }
   };
 
+  const handlePreloadToggle = (enabled) => {
+    setIsPreloadEnabled(enabled);
+
+    // Start preparing every level for a document that is already simplified
+    if (enabled && originalText) {
+      axios.post(`${API_URL}/api/simplify/prefetch`, {
+        text: originalText,
+      }).catch((err) => console.error("Error:", err));
+    }
+  };
+
+  const handleReadingLevelChange = async (level) => {
+    setReadingLevel(level);
+
+    // With preloading on, the backend already holds every level for this document
+    if (!isPreloadEnabled || !originalText) {
+      return;
+    }
+
+    const requestId = ++latestRequestRef.current;
+    try {
+      setIsLoading(true);
+      setError(null);
+
+      // Audio is generated separately once the new text arrives, so the switch is not held up
+      const response = await axios.post(`${API_URL}/api/simplify`, {
+        text: originalText,
+        reading_level: level,
+        text_to_speech: false,
+        speculative: true,
+      });
+
+      if (requestId !== latestRequestRef.current) {
+        return;
+      }
+      setSimplifiedText(response.data.simplified_text);
+      setAudioUrl(null);
+    } catch (error) {
+      if (requestId === latestRequestRef.current) {
+        setError("An error occurred while switching the reading level. Please try again.");
+      }
+      console.error("Error:", error);
+    } finally {
+      if (requestId === latestRequestRef.current) {
+        setIsLoading(false);
+      }
+    }
+  };
+
   const handleTextSubmit = async (text) => {
+    const requestId = ++latestRequestRef.current;
     try {
       setIsLoading(true);
       setError(null);
@@ -76,24 +129,34 @@ const SimplificationPage = () => {
         text,
         reading_level: readingLevel,
         text_to_speech: isTextToSpeechEnabled,
+        speculative: isPreloadEnabled,
       });
 
+      if (requestId !== latestRequestRef.current) {
+        return;
+      }
       setSimplifiedText(response.data.simplified_text);
       if (response.data.audio_url) {
         setAudioUrl(`${API_URL}${response.data.audio_url}`);
       }
     } catch (error) {
-      setError("An error occurred while simplifying the text. Please try again.");
+      if (requestId === latestRequestRef.current) {
+        setError("An error occurred while simplifying the text. Please try again.");
+      }
       console.error("Error:", error);
     } finally {
-      setIsLoading(false);
+      if (requestId === latestRequestRef.current) {
+        setIsLoading(false);
+      }
     }
   };
 
   const handleFileUpload = async (file) => {
+    const requestId = ++latestRequestRef.current;
     try {
       setIsLoading(true);
       setError(null);
+      setOriginalText("");
       setSimplifiedText("");
       setAudioUrl(null);
 
@@ -101,19 +164,27 @@ const SimplificationPage = () => {
       formData.append("file", file);
       formData.append("reading_level", readingLevel);
       formData.append("text_to_speech", isTextToSpeechEnabled);
+      formData.append("speculative", isPreloadEnabled);
 
       const response = await axios.post(`${API_URL}/api/upload`, formData);
 
+      if (requestId !== latestRequestRef.current) {
+        return;
+      }
       setOriginalText(response.data.original_text);
       setSimplifiedText(response.data.simplified_text);
       if (response.data.audio_url) {
         setAudioUrl(`${API_URL}${response.data.audio_url}`);
       }
     } catch (error) {
-      setError("An error occurred while processing the file. Please try again.");
+      if (requestId === latestRequestRef.current) {
+        setError("An error occurred while processing the file. Please try again.");
+      }
       console.error("Error:", error);
     } finally {
-      setIsLoading(false);
+      if (requestId === latestRequestRef.current) {
+        setIsLoading(false);
+      }
     }
   };
 
@@ -162,9 +233,11 @@ const SimplificationPage = () => {
                 <Divider sx={{ mb: 3 }} />
                 <SimplificationOptions
                   readingLevel={readingLevel}
-                  onReadingLevelChange={setReadingLevel}
+                  onReadingLevelChange={handleReadingLevelChange}
                   isTextToSpeechEnabled={isTextToSpeechEnabled}
                   onTextToSpeechToggle={handleTextToSpeechToggle}
+                  isPreloadEnabled={isPreloadEnabled}
+                  onPreloadToggle={handlePreloadToggle}
                 />
               </Box>
             </Paper>